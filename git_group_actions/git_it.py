@@ -1,32 +1,74 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
 import json
+import os
 import subprocess
 import sys
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Tuple, Optional, Dict, Any
+from typing import Iterator, List, Tuple, Optional, Dict, Any, Union
 
-HAD_ERRORS: bool = False
+# Cap on concurrently running git subprocesses in the async fan-out.
+SUBPROCESS_LIMIT: int = 64
 
+# Strip the slow/interactive bits out of git's environment: no pager, no
+# terminal prompts, no optional index locks, no GPG signing, no auto-gc.
+GIT_ENV: Dict[str, str] = {
+    **os.environ,
+    "GIT_PAGER": "cat",
+    "GIT_TERMINAL_PROMPT": "0",
+    "GIT_OPTIONAL_LOCKS": "0",
+    "GIT_CONFIG_COUNT": "2",
+    "GIT_CONFIG_KEY_0": "commit.gpgsign",
+    "GIT_CONFIG_VALUE_0": "false",
+    "GIT_CONFIG_KEY_1": "gc.auto",
+    "GIT_CONFIG_VALUE_1": "0",
+}
 
-def report_error(repo: Optional[Path], cmd: List[str], returncode: int, stderr_text: str) -> None:
+
+@dataclass
+class CmdResult:
+    """Outcome of one subprocess invocation."""
+
+    cmd: List[str]
+    code: int
+    out: Union[str, bytes]
+    err: str
+
+    @property
+    def ok(self) -> bool:
+        return self.code == 0
+
+
+@dataclass
+class RepoReport:
+    """Per-repo result collected by a worker; errors travel with it instead
+    of mutating shared state, so workers stay parallelism-safe."""
+
+    path: Path
+    is_repo: bool
+    uncommitted: Optional[bool] = None
+    unpushed: Optional[int] = None
+    errors: List[CmdResult] = field(default_factory=list)
+
+
+def print_error(repo: Optional[Path], result: CmdResult) -> None:
     """
-    Log an error for a given repo/command and mark global error flag.
+    Log a failed command for a given repo to stderr.
     """
-    global HAD_ERRORS
-    HAD_ERRORS = True
     target = repo.name if repo is not None else "."
-    command_str = " ".join(cmd)
-    sys.stderr.write(f"❌ [{target}] Command failed (exit {returncode}): {command_str}\n")
-    if stderr_text.strip():
-        sys.stderr.write(f"   ↳ {stderr_text.strip()}\n")
+    command_str = " ".join(result.cmd)
+    sys.stderr.write(f"❌ [{target}] Command failed (exit {result.code}): {command_str}\n")
+    if result.err.strip():
+        sys.stderr.write(f"   ↳ {result.err.strip()}\n")
 
 
-def run_cmd(args: List[str], cwd: Path) -> Tuple[int, str, str]:
+def run_cmd(args: List[str], cwd: Path) -> CmdResult:
     """
-    Run a subprocess command and return (returncode, stdout, stderr).
-    Always catches FileNotFoundError and reports it as an error.
+    Run a subprocess command and return a CmdResult.
+    Always catches FileNotFoundError and returns it as a failure.
     """
     try:
         result = subprocess.run(
@@ -35,11 +77,29 @@ def run_cmd(args: List[str], cwd: Path) -> Tuple[int, str, str]:
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             text=True,
+            env=GIT_ENV,
         )
-        return result.returncode, result.stdout, result.stderr
+        return CmdResult(args, result.returncode, result.stdout, result.stderr)
     except FileNotFoundError as exc:
-        report_error(cwd, args, 127, f"Executable not found: {exc}")
-        return 127, "", str(exc)
+        return CmdResult(args, 127, "", f"Executable not found: {exc}")
+
+
+def run_cmd_bytes(args: List[str], cwd: Path) -> CmdResult:
+    """
+    Like run_cmd, but leaves stdout as bytes. json.loads accepts bytes
+    directly, so JSON-producing commands skip the Python-level decode.
+    """
+    try:
+        result = subprocess.run(
+            args,
+            cwd=str(cwd),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            env=GIT_ENV,
+        )
+        return CmdResult(args, result.returncode, result.stdout, result.stderr.decode("utf-8", "replace"))
+    except FileNotFoundError as exc:
+        return CmdResult(args, 127, b"", f"Executable not found: {exc}")
 
 
 def is_git_repo(path: Path) -> bool:
@@ -49,46 +109,113 @@ def is_git_repo(path: Path) -> bool:
     return (path / ".git").exists()
 
 
-def has_uncommitted_changes(path: Path) -> Optional[bool]:
+# --no-optional-locks skips the index-lock write so concurrent probes
+# don't contend on .git/index.lock.
+STATUS_CMD: List[str] = ["git", "--no-optional-locks", "status", "--porcelain=v2", "--branch", "--ahead-behind"]
+
+
+def parse_porcelain_v2(out: str, code: int, errors: List[CmdResult]) -> Tuple[bool, Optional[int]]:
     """
-    Return True if there are uncommitted changes, False if clean.
-    If an error occurs, report it and return None.
+    Parse `git status --porcelain=v2 --branch` output into
+    (has_uncommitted, unpushed_count).
+
+    The `# branch.ab +N -M` header carries the ahead count, and every
+    non-header line is a dirty path. The ahead count is None when the
+    branch has no upstream. Parse failures are appended to `errors`.
     """
-    code, out, err = run_cmd(["git", "status", "--porcelain"], path)
+    uncommitted = False
+    unpushed: Optional[int] = None
+    for line in out.splitlines():
+        if line.startswith("# branch.ab "):
+            try:
+                unpushed = int(line.split()[2])
+            except (IndexError, ValueError):
+                errors.append(CmdResult(STATUS_CMD, code, out, f"Unexpected output: {line}"))
+        elif line and not line.startswith("#"):
+            uncommitted = True
+    return uncommitted, unpushed
+
+
+async def get_repo_state(path: Path, errors: List[CmdResult]) -> Tuple[Optional[bool], Optional[int]]:
+    """
+    Return (has_uncommitted, unpushed_count) from a single `git status`
+    subprocess, multiplexed on the event loop rather than a thread.
+    Failures are appended to `errors`.
+    """
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *STATUS_CMD,
+            cwd=str(path),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env=GIT_ENV,
+        )
+    except FileNotFoundError as exc:
+        errors.append(CmdResult(STATUS_CMD, 127, "", f"Executable not found: {exc}"))
+        return None, None
+
+    out_b, err_b = await proc.communicate()
+    code = proc.returncode or 0
+    out = out_b.decode("utf-8", "replace")
     if code != 0:
-        report_error(path, ["git", "status", "--porcelain"], code, err)
-        return None
-    return bool(out.strip())
+        errors.append(CmdResult(STATUS_CMD, code, out, err_b.decode("utf-8", "replace")))
+        return None, None
+
+    return parse_porcelain_v2(out, code, errors)
 
 
-def get_unpushed_commit_count(path: Path) -> Optional[int]:
+def get_unpushed_commit_count(path: Path, errors: List[CmdResult]) -> Optional[int]:
     """
     Return count of commits ahead of upstream, or 0 if none.
-    If no upstream or an error occurs, report it and return None.
+    If no upstream or an error occurs, append it to `errors` and return None.
     """
-    code, out, err = run_cmd(["git", "rev-list", "--count", "@{u}..HEAD"], path)
-    if code != 0:
+    cmd = ["git", "rev-list", "--count", "@{u}..HEAD"]
+    result = run_cmd(cmd, path)
+    if not result.ok:
         # No upstream or some error – treat as error but don't guess.
-        report_error(path, ["git", "rev-list", "--count", "@{u}..HEAD"], code, err)
+        errors.append(result)
         return None
-    text = out.strip()
+    text = result.out.strip()
     try:
         return int(text)
     except ValueError:
-        report_error(path, ["git", "rev-list", "--count", "@{u}..HEAD"], code, f"Unexpected output: {text}")
+        errors.append(CmdResult(cmd, result.code, result.out, f"Unexpected output: {text}"))
         return None
 
 
-def iter_child_dirs(root: Path) -> List[Path]:
+def iter_child_dirs_unsorted(root: Path) -> Iterator[Path]:
+    """
+    Lazily yield immediate child directories of root in directory order.
+
+    Used by commands that don't care about ordering, so work can start
+    before the whole listing is materialized and sorted.
+    """
+    # os.scandir answers is_dir() from the readdir entry without re-stat-ing.
+    with os.scandir(root) as it:
+        for e in it:
+            if e.is_dir(follow_symlinks=False):
+                yield Path(e.path)
+
+
+def iter_child_dirs_sorted(root: Path) -> List[Path]:
     """
     Return a sorted list of immediate child directories of root.
     """
-    return sorted([p for p in root.iterdir() if p.is_dir()], key=lambda p: p.name.lower())
+    dirs = list(iter_child_dirs_unsorted(root))
+    dirs.sort(key=lambda p: p.name.lower())
+    return dirs
+
 
+def enable_untracked_cache(path: Path) -> None:
+    """Opportunistically enable git's untracked cache for faster `git status`."""
+    run_cmd(["git", "config", "core.untrackedCache", "true"], path)
+    run_cmd(["git", "update-index", "--untracked-cache"], path)
 
-def cmd_stranded(root: Path, verbose: bool) -> None:
+
+def cmd_stranded(root: Path, verbose: bool, untracked_cache: bool = False) -> bool:
     """
     Inspect repos for uncommitted or unpushed work.
+    Returns True if any command failed.
     """
     uncommitted: List[Path] = []
     unpushed: List[Tuple[Path, int]] = []
@@ -97,22 +224,41 @@ def cmd_stranded(root: Path, verbose: bool) -> None:
 
     print("🔍 Checking for stranded work…")
 
-    for d in iter_child_dirs(root):
-        if not is_git_repo(d):
-            non_git.append(d)
-            continue
+    async def gather_reports(dirs: List[Path]) -> List[RepoReport]:
+        # One event loop multiplexes all the git subprocesses; the
+        # semaphore keeps the number of live processes bounded.
+        sem = asyncio.Semaphore(SUBPROCESS_LIMIT)
+
+        async def probe(d: Path) -> RepoReport:
+            if not is_git_repo(d):
+                return RepoReport(d, is_repo=False)
+            report = RepoReport(d, is_repo=True)
+            async with sem:
+                if untracked_cache:
+                    await asyncio.to_thread(enable_untracked_cache, d)
+                report.uncommitted, report.unpushed = await get_repo_state(d, report.errors)
+            return report
 
-        uncomm = has_uncommitted_changes(d)
-        unpushed_count = get_unpushed_commit_count(d)
+        return list(await asyncio.gather(*(probe(d) for d in dirs)))
 
-        if uncomm:
-            uncommitted.append(d)
+    reports = asyncio.run(gather_reports(iter_child_dirs_sorted(root)))
 
-        if unpushed_count is not None and unpushed_count > 0:
-            unpushed.append((d, unpushed_count))
+    for report in reports:
+        for error in report.errors:
+            print_error(report.path, error)
+
+        if not report.is_repo:
+            non_git.append(report.path)
+            continue
 
-        if uncomm is False and (unpushed_count == 0):
-            clean.append(d)
+        if report.uncommitted:
+            uncommitted.append(report.path)
+
+        if report.unpushed is not None and report.unpushed > 0:
+            unpushed.append((report.path, report.unpushed))
+
+        if report.uncommitted is False and (report.unpushed == 0):
+            clean.append(report.path)
 
     if uncommitted:
         print("✏️ Repos with uncommitted changes:")
@@ -138,39 +284,53 @@ def cmd_stranded(root: Path, verbose: bool) -> None:
             for d in non_git:
                 print(f"  - {d.name}")
 
+    return any(r.errors for r in reports)
 
-def cmd_pull(root: Path) -> None:
+
+def cmd_pull(root: Path) -> bool:
     """
     Fetch and pull all git repos using the currently active branch.
+    Returns True if any command failed.
     """
+    had_errors = False
     print("⬇️  Fetching and pulling all repositories…")
-    for d in iter_child_dirs(root):
+    for d in iter_child_dirs_unsorted(root):
         if not is_git_repo(d):
             continue
         print(f"📥 [{d.name}] git fetch && git pull")
-        code_f, out_f, err_f = run_cmd(["git", "fetch", "--all"], d)
-        if code_f != 0:
-            report_error(d, ["git", "fetch", "--all"], code_f, err_f)
-        elif out_f.strip():
-            print(out_f.strip())
+        fetch = run_cmd(["git", "fetch", "--all"], d)
+        if not fetch.ok:
+            had_errors = True
+            print_error(d, fetch)
+        elif fetch.out.strip():
+            print(fetch.out.strip())
+
+        pull = run_cmd(["git", "pull"], d)
+        if not pull.ok:
+            had_errors = True
+            print_error(d, pull)
+        elif pull.out.strip():
+            print(pull.out.strip())
 
-        code_p, out_p, err_p = run_cmd(["git", "pull"], d)
-        if code_p != 0:
-            report_error(d, ["git", "pull"], code_p, err_p)
-        elif out_p.strip():
-            print(out_p.strip())
+    return had_errors
 
 
-def cmd_push(root: Path) -> None:
+def cmd_push(root: Path) -> bool:
     """
     Push all repos that have unpushed commits. Do not stage anything.
+    Returns True if any command failed.
     """
+    had_errors = False
     print("⬆️  Pushing repositories with unpushed commits…")
-    for d in iter_child_dirs(root):
+    for d in iter_child_dirs_sorted(root):
         if not is_git_repo(d):
             continue
 
-        count = get_unpushed_commit_count(d)
+        errors: List[CmdResult] = []
+        count = get_unpushed_commit_count(d, errors)
+        for error in errors:
+            had_errors = True
+            print_error(d, error)
         if count is None:
             # Error already reported; skip.
             continue
@@ -178,87 +338,122 @@ def cmd_push(root: Path) -> None:
             continue
 
         print(f"🚀 [{d.name}] git push (ahead by {count} commit{'s' if count != 1 else ''})")
-        code, out, err = run_cmd(["git", "push"], d)
-        if code != 0:
-            report_error(d, ["git", "push"], code, err)
-        elif out.strip():
-            print(out.strip())
+        push = run_cmd(["git", "push"], d)
+        if not push.ok:
+            had_errors = True
+            print_error(d, push)
+        elif push.out.strip():
+            print(push.out.strip())
+
+    return had_errors
+
+
+def get_origin_slug(path: Path) -> Optional[Tuple[str, str]]:
+    """
+    Return (owner, name) parsed from the origin remote URL, or None if the
+    repo has no GitHub origin.
+    """
+    result = run_cmd(["git", "config", "--get", "remote.origin.url"], path)
+    if not result.ok:
+        return None
+    url = result.out.strip()
+    if "github.com" not in url:
+        return None
+    tail = url.split("github.com", 1)[1].lstrip(":/")
+    parts = tail.split("/")
+    if len(parts) < 2 or not parts[0] or not parts[1]:
+        return None
+    name = parts[1]
+    if name.endswith(".git"):
+        name = name[:-4]
+    return parts[0], name
+
 
+# Repos per aliased GraphQL request.
+GRAPHQL_BATCH = 100
 
-def cmd_failing(root: Path) -> None:
+
+def cmd_failing(root: Path) -> bool:
     """
-    For each local git repo, use `gh` to check the most recent GitHub Action run.
-    Report repos where the most recent run concluded with failure.
+    Check the latest GitHub Actions check suite on each repo's default
+    branch, batching all repos into aliased GraphQL queries instead of one
+    `gh run list` per repo. Report repos whose latest suite failed.
+    Returns True if any command failed.
     """
     print("🧪 Checking GitHub Actions for failing workflows…")
     any_reported = False
+    had_errors = False
 
-    for d in iter_child_dirs(root):
+    # Discovering the slug is a cheap local git call; the network round
+    # trips collapse to ceil(N/100).
+    slugs: List[Tuple[Path, str, str]] = []
+    for d in iter_child_dirs_unsorted(root):
         if not is_git_repo(d):
             continue
-
-        code, out, err = run_cmd(
-            [
-                "gh",
-                "run",
-                "list",
-                "--limit",
-                "1",
-                "--json",
-                "status,conclusion,name,headBranch,headSha",
-            ],
-            d,
-        )
-        if code != 0:
-            report_error(
-                d,
-                ["gh", "run", "list", "--limit", "1", "--json", "status,conclusion,name,headBranch,headSha"],
-                code,
-                err,
+        slug = get_origin_slug(d)
+        if slug is not None:
+            slugs.append((d, slug[0], slug[1]))
+
+    for start in range(0, len(slugs), GRAPHQL_BATCH):
+        batch = slugs[start : start + GRAPHQL_BATCH]
+        parts = []
+        for i, (_, owner, name) in enumerate(batch):
+            parts.append(
+                f'r{i}: repository(owner: "{owner}", name: "{name}") {{'
+                " defaultBranchRef { name target { ... on Commit {"
+                " oid checkSuites(last: 1) { nodes {"
+                " status conclusion workflowRun { workflow { name } }"
+                " } } } } } }"
             )
-            continue
+        query = "query {\n" + "\n".join(parts) + "\n}"
 
-        text = out.strip()
-        if not text:
-            # No runs.
+        result = run_cmd_bytes(["gh", "api", "graphql", "-f", f"query={query}"], root)
+        if not result.ok:
+            had_errors = True
+            print_error(None, result)
             continue
 
         try:
-            data: List[Dict[str, Any]] = json.loads(text)
+            data: Dict[str, Any] = json.loads(result.out).get("data") or {}
         except json.JSONDecodeError as exc:
-            report_error(
-                d,
-                ["gh", "run", "list", "--limit", "1", "--json", "status,conclusion,name,headBranch,headSha"],
-                code,
-                f"JSON decode error: {exc}",
-            )
-            continue
-
-        if not data:
+            had_errors = True
+            print_error(None, CmdResult(result.cmd, result.code, result.out, f"JSON decode error: {exc}"))
             continue
 
-        run = data[0]
-        status = str(run.get("status", ""))
-        conclusion = str(run.get("conclusion", ""))
-        name = str(run.get("name", ""))
-        branch = str(run.get("headBranch", ""))
-        sha = str(run.get("headSha", ""))
-
-        # Treat explicit failure conclusion as "failing".
-        if conclusion.lower() == "failure":
-            any_reported = True
-            print(
-                f"💥 [{d.name}] Most recent workflow is failing\n"
-                f"    • Name: {name}\n"
-                f"    • Branch: {branch}\n"
-                f"    • SHA: {sha}\n"
-                f"    • Status: {status}\n"
-                f"    • Conclusion: {conclusion}"
-            )
+        for i, (d, _owner, _name) in enumerate(batch):
+            node = data.get(f"r{i}") or {}
+            ref = node.get("defaultBranchRef") or {}
+            target = ref.get("target") or {}
+            suites = (target.get("checkSuites") or {}).get("nodes") or []
+            if not suites:
+                # No runs.
+                continue
+
+            suite = suites[0]
+            status = str(suite.get("status") or "")
+            conclusion = str(suite.get("conclusion") or "")
+            workflow = (suite.get("workflowRun") or {}).get("workflow") or {}
+            name = str(workflow.get("name") or "")
+            branch = str(ref.get("name") or "")
+            sha = str(target.get("oid") or "")
+
+            # Treat explicit failure conclusion as "failing".
+            if conclusion.lower() == "failure":
+                any_reported = True
+                print(
+                    f"💥 [{d.name}] Most recent workflow is failing\n"
+                    f"    • Name: {name}\n"
+                    f"    • Branch: {branch}\n"
+                    f"    • SHA: {sha}\n"
+                    f"    • Status: {status}\n"
+                    f"    • Conclusion: {conclusion}"
+                )
 
     if not any_reported:
         print("✅ No failing workflows detected (based on most recent runs).")
 
+    return had_errors
+
 
 def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(
@@ -275,28 +470,32 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
         action="store_true",
         help="For 'stranded' commands, also list clean repos and non-git directories.",
     )
+    parser.add_argument(
+        "--enable-untracked-cache",
+        action="store_true",
+        help="For 'stranded' commands, turn on git's untracked cache in each repo before scanning.",
+    )
     return parser.parse_args(argv)
 
 
 def main(argv: Optional[List[str]] = None) -> None:
-    global HAD_ERRORS
     args = parse_args(argv)
     root = Path.cwd()
 
     if args.command in ("stranded", "stranded-commits"):
-        cmd_stranded(root, verbose=args.verbose)
+        had_errors = cmd_stranded(root, verbose=args.verbose, untracked_cache=args.enable_untracked_cache)
     elif args.command == "pull":
-        cmd_pull(root)
+        had_errors = cmd_pull(root)
     elif args.command == "push":
-        cmd_push(root)
+        had_errors = cmd_push(root)
     elif args.command == "failing":
-        cmd_failing(root)
+        had_errors = cmd_failing(root)
     else:
         # Argparse should prevent this, but keep a guard anyway.
-        report_error(None, [str(args.command)], 1, "Unknown command")
+        print_error(None, CmdResult([str(args.command)], 1, "", "Unknown command"))
         sys.exit(1)
 
-    if HAD_ERRORS:
+    if had_errors:
         print("⚠️  Completed with errors. See stderr for details.", file=sys.stderr)
         sys.exit(1)
     else:
@@ -3,15 +3,18 @@
 Scan current directory and report which subfolders are NOT git repositories.
 """
 
+import os
 from pathlib import Path
 
 def find_non_git_repos(root: Path) -> list[Path]:
     """Return subdirectories under `root` that do not contain a .git directory."""
+    # os.scandir answers is_dir() from the readdir entry without re-stat-ing.
     results: list[Path] = []
-    for entry in root.iterdir():
-        if entry.is_dir():
-            if not (entry / ".git").is_dir():
-                results.append(entry)
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                if not os.path.isdir(os.path.join(entry.path, ".git")):
+                    results.append(Path(entry.path))
     return results
 
 
@@ -2,6 +2,7 @@
 import json
 import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import logging
 import sys
@@ -10,6 +11,13 @@ import sys
 # Set to True to only log what would be deleted without actually deleting.
 DRY_RUN = False
 
+# Cache of which subdirectories are git repos, keyed by the parent
+# directory's mtime so warm runs skip the per-directory stats.
+CACHE_FILE = Path.home() / ".cache" / "useful_scripts" / "repos.json"
+
+# Concurrent run deletions per repo; deletes are network bound.
+DELETE_WORKERS = 8
+
 # ===== Logging setup =====
 logging.basicConfig(
     level=logging.INFO,
@@ -20,26 +28,66 @@ log = logging.getLogger("precommit_ci_cleanup")
 
 def is_git_repo(path: Path) -> bool:
     """Return True if path is a git repository."""
-    if (path / ".git").exists():
-        return True
+    # The .is_file() branch handles worktrees/submodules where .git is a
+    # gitfile pointer rather than a directory.
+    dot_git = path / ".git"
+    return dot_git.is_dir() or dot_git.is_file()
 
+
+def list_repo_dirs(root: Path) -> list[Path]:
+    """
+    Return direct subdirectories of `root` that are git repos.
+
+    Results are cached on disk keyed by `root`'s mtime, so a rerun over an
+    unchanged directory costs one stat instead of one per subdirectory.
+    """
+    key = str(root)
     try:
-        result = subprocess.run(
-            ["git", "rev-parse", "--is-inside-work-tree"],
-            cwd=path,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            check=False,
-        )
-        return result.returncode == 0 and result.stdout.strip() == "true"
-    except FileNotFoundError:
-        log.error("❌ git not found on PATH.")
-        return False
+        mtime_ns = os.stat(root).st_mtime_ns
+    except OSError:
+        mtime_ns = None
+
+    try:
+        cache = json.loads(CACHE_FILE.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        cache = {}
+
+    entry = cache.get(key)
+    if mtime_ns is not None and entry and entry.get("mtime_ns") == mtime_ns:
+        log.debug("📒 Using cached repo list for %s", root)
+        return [root / name for name in entry["repos"]]
+
+    names: list[str] = []
+    with os.scandir(root) as it:
+        for e in it:
+            if not e.is_dir(follow_symlinks=False):
+                continue
+            # Skip .git etc
+            if e.name.startswith("."):
+                continue
+            if is_git_repo(Path(e.path)):
+                names.append(e.name)
+            else:
+                log.debug("📁 Skipping non-git directory: %s", e.path)
+    names.sort()
+
+    if mtime_ns is not None:
+        cache[key] = {"mtime_ns": mtime_ns, "repos": names}
+        try:
+            CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            CACHE_FILE.write_text(json.dumps(cache), encoding="utf-8")
+        except OSError as e:
+            log.debug("📒 Could not write repo cache: %s", e)
+
+    return [root / name for name in names]
 
 
 def run_gh(args, cwd: Path):
-    """Run `gh` with given args and return stdout text or None on error."""
+    """Run `gh` with given args and return stdout bytes or None on error.
+
+    Output stays as bytes because json.loads accepts bytes directly; this
+    skips a full decode of the (potentially large) run listing.
+    """
     cmd = ["gh"] + args
     log.debug("🔧 Running: %s (cwd=%s)", " ".join(cmd), cwd)
     try:
@@ -48,7 +96,6 @@ def run_gh(args, cwd: Path):
             cwd=cwd,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            text=True,
             check=False,
         )
     except FileNotFoundError:
@@ -56,7 +103,7 @@ def run_gh(args, cwd: Path):
         return None
 
     if result.returncode != 0:
-        log.error("⚠️ gh command failed in %s: %s", cwd, result.stderr.strip())
+        log.error("⚠️ gh command failed in %s: %s", cwd, result.stderr.decode("utf-8", "replace").strip())
         return None
 
     return result.stdout
@@ -97,15 +144,28 @@ def list_precommit_runs(repo_path: Path):
 
 
 def delete_run(repo_path: Path, run_id: int, title: str):
-    """Delete a single run by numeric ID using gh."""
+    """Delete a single run by numeric ID via the REST endpoint."""
     if DRY_RUN:
         log.info("🧪 DRY RUN: would delete run %s (%s) in %s", run_id, title, repo_path)
         return
 
-    stdout = run_gh(["run", "delete", str(run_id)], cwd=repo_path)
+    # gh resolves the {owner}/{repo} placeholders from the repo at cwd.
+    stdout = run_gh(
+        ["api", "--method", "DELETE", f"repos/{{owner}}/{{repo}}/actions/runs/{run_id}"],
+        cwd=repo_path,
+    )
     if stdout is not None:
         log.info("🗑️ Deleted run %s (%s) in %s", run_id, title, repo_path)
 
+
+def delete_runs(repo_path: Path, runs: list[tuple[int, str]]):
+    """Delete a batch of runs concurrently instead of one gh call at a time."""
+    if not runs:
+        return
+    with ThreadPoolExecutor(max_workers=DELETE_WORKERS) as ex:
+        for _ in ex.map(lambda pair: delete_run(repo_path, pair[0], pair[1]), runs):
+            pass
+
 def process_repo(repo_path: Path):
     """Scan a single repo for pre-commit.ci runs and delete them."""
     log.info("📦 Scanning repo: %s", repo_path)
@@ -116,6 +176,7 @@ def process_repo(repo_path: Path):
         return
 
     log.info("🔎 Found %d [pre-commit.ci] runs in %s", len(runs), repo_path)
+    deletable: list[tuple[int, str]] = []
     for run in runs:
         run_id = run.get("databaseId")
         title = run.get("displayTitle", "<no title>")
@@ -136,25 +197,18 @@ def process_repo(repo_path: Path):
             log.warning("⚠️ Skipping run with missing databaseId in %s", repo_path)
             continue
 
-        delete_run(repo_path, run_id, title)
+        deletable.append((run_id, title))
+
+    delete_runs(repo_path, deletable)
 
 
 def main():
     base = Path(".").resolve()
     log.info("🚀 Starting pre-commit.ci cleanup in %s (DRY_RUN=%s)", base, DRY_RUN)
 
-    # Loop over direct subdirectories
-    for entry in sorted(base.iterdir()):
-        if not entry.is_dir():
-            continue
-        # Skip .git etc
-        if entry.name.startswith("."):
-            continue
-
-        if is_git_repo(entry):
-            process_repo(entry)
-        else:
-            log.debug("📁 Skipping non-git directory: %s", entry)
+    # Loop over direct subdirectories (cached on warm runs)
+    for repo in list_repo_dirs(base):
+        process_repo(repo)
 
     log.info("🏁 Done.")
 
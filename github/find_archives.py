@@ -14,11 +14,13 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Set
+from typing import List, Optional, Set
 
 
 @dataclass
@@ -30,60 +32,98 @@ class RepoInfo:
     url: str
 
 
-def run_gh_repo_list(user: str) -> List[RepoInfo]:
-    """Call `gh repo list` and return structured repo info."""
-    cmd = [
-        "gh",
-        "repo",
-        "list",
-        user,
-        "--limit",
-        "1000",
-        "--json",
-        "name,isFork,isArchived,updatedAt,url",
-    ]
+def parse_iso8601(s: str) -> datetime:
+    """Parse GitHub's ISO 8601 timestamps.
+
+    GitHub nearly always ends them with "Z"; slicing it off and attaching
+    tzinfo directly skips the str.replace allocation per timestamp.
+    """
+    if s.endswith("Z"):
+        return datetime.fromisoformat(s[:-1]).replace(tzinfo=timezone.utc)
+    return datetime.fromisoformat(s)
+
+
+# One GraphQL round trip per 100 repos, instead of letting `gh repo list`
+# paginate REST calls internally.
+REPO_LIST_QUERY = """
+query($login: String!, $cursor: String) {
+  repositoryOwner(login: $login) {
+    repositories(first: 100, after: $cursor, ownerAffiliations: OWNER) {
+      pageInfo { endCursor hasNextPage }
+      nodes { name isFork isArchived updatedAt url }
+    }
+  }
+}
+"""
 
-    try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-    except subprocess.CalledProcessError as exc:
-        raise RuntimeError(
-            f"Failed to run gh repo list: {exc.stderr.strip() or exc.stdout.strip()}"
-        ) from exc
-
-    try:
-        raw = json.loads(result.stdout)
-    except json.JSONDecodeError as exc:
-        raise RuntimeError("Failed to parse JSON from gh output") from exc
 
+def run_gh_repo_list(user: str) -> List[RepoInfo]:
+    """Fetch repo info for `user` via a paginated GraphQL query."""
     repos: List[RepoInfo] = []
-    for item in raw:
-        updated_raw = item.get("updatedAt")
-        # GitHub returns ISO 8601, usually with trailing Z
-        if not isinstance(updated_raw, str):
-            continue
-        updated = datetime.fromisoformat(updated_raw.replace("Z", "+00:00"))
-
-        repos.append(
-            RepoInfo(
-                name=item["name"],
-                is_fork=bool(item.get("isFork")),
-                is_archived=bool(item.get("isArchived")),
-                updated_at=updated,
-                url=item.get("url", ""),
+    cursor: Optional[str] = None
+
+    while True:
+        cmd = [
+            "gh",
+            "api",
+            "graphql",
+            "-f",
+            f"query={REPO_LIST_QUERY}",
+            "-F",
+            f"login={user}",
+        ]
+        if cursor:
+            cmd += ["-F", f"cursor={cursor}"]
+
+        try:
+            # Bytes mode: json.loads accepts bytes, so skip the decode pass.
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                check=True,
+            )
+        except subprocess.CalledProcessError as exc:
+            detail = (exc.stderr or exc.stdout or b"").decode("utf-8", "replace").strip()
+            raise RuntimeError(f"Failed to run gh api graphql: {detail}") from exc
+
+        try:
+            raw = json.loads(result.stdout)
+        except json.JSONDecodeError as exc:
+            raise RuntimeError("Failed to parse JSON from gh output") from exc
+
+        owner = (raw.get("data") or {}).get("repositoryOwner") or {}
+        page = owner.get("repositories") or {}
+
+        for item in page.get("nodes") or []:
+            updated_raw = item.get("updatedAt")
+            # GitHub returns ISO 8601, usually with trailing Z
+            if not isinstance(updated_raw, str):
+                continue
+            updated = parse_iso8601(updated_raw)
+
+            repos.append(
+                RepoInfo(
+                    name=item["name"],
+                    is_fork=bool(item.get("isFork")),
+                    is_archived=bool(item.get("isArchived")),
+                    updated_at=updated,
+                    url=item.get("url", ""),
+                )
             )
-        )
+
+        page_info = page.get("pageInfo") or {}
+        if not page_info.get("hasNextPage"):
+            break
+        cursor = page_info.get("endCursor")
 
     return repos
 
 
 def find_local_dirs(root: Path) -> Set[str]:
     """Return a set of directory names directly under root."""
-    return {p.name for p in root.iterdir() if p.is_dir()}
+    # os.scandir answers is_dir() from the readdir entry without re-stat-ing.
+    with os.scandir(root) as it:
+        return {e.name for e in it if e.is_dir(follow_symlinks=False)}
 
 
 def compute_uncloned_repos(
@@ -136,10 +176,15 @@ def main() -> None:
 
     root: Path = args.path.resolve()
     print(f"🔍 Scanning local path: {root}")
-    local_dirs = find_local_dirs(root)
-
     print(f"🌐 Querying GitHub user: {args.user}")
-    repos = run_gh_repo_list(args.user)
+
+    # The local scan and the GitHub query are independent; overlapping them
+    # makes wall time max(disk, network) instead of their sum.
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        f_local = ex.submit(find_local_dirs, root)
+        f_gh = ex.submit(run_gh_repo_list, args.user)
+        local_dirs = f_local.result()
+        repos = f_gh.result()
 
     uncloned = compute_uncloned_repos(repos, local_dirs)
 
@@ -2,13 +2,21 @@
 from __future__ import annotations
 
 import argparse
-import json
+import concurrent.futures as cf
+import configparser
 import logging
+import os
 import subprocess
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Iterable, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import gh_cache
+
+
+# Each worker just waits on a git/gh subprocess, so oversubscribe cores.
+DEFAULT_JOBS = min(32, (os.cpu_count() or 4) * 4)
 
 
 @dataclass
@@ -122,14 +130,49 @@ def parse_github_remote(remote_url: str) -> Optional[Tuple[str, str]]:
     return owner, repo
 
 
-def get_repo_remote_owner_name(repo_path: Path) -> Optional[Tuple[str, str]]:
-    """Get (owner, repo_name) for the 'origin' remote of a given repo."""
+def get_origin_url(repo_path: Path) -> Optional[str]:
+    """
+    Return the origin remote URL for `repo_path`.
+
+    Answers come from the shared on-disk origins cache (keyed on
+    .git/config's mtime) when possible; `_resolve_origin_url` does the
+    real lookup on a miss.
+    """
+    return gh_cache.origin_url(repo_path, _resolve_origin_url)
+
+
+def _resolve_origin_url(repo_path: Path) -> Optional[str]:
+    """
+    Read the origin remote URL from .git/config directly.
+
+    The URL lives in plain text under [remote "origin"], so a configparser
+    read replaces a git subprocess per repo; `git remote get-url` stays as
+    the fallback for exotic setups (gitfile worktrees, includes, ...).
+    """
+    config_path = repo_path / ".git" / "config"
+    try:
+        cfg = configparser.ConfigParser(strict=False)
+        cfg.read(config_path, encoding="utf-8")
+        url = cfg.get('remote "origin"', "url", fallback=None)
+        if url:
+            return url
+    except (OSError, configparser.Error) as e:
+        logging.debug("Could not parse %s (%s); falling back to git", config_path, e)
+
     stdout = run_command(["git", "-C", str(repo_path), "remote", "get-url", "origin"])
     if stdout is None:
+        return None
+    return stdout.strip() or None
+
+
+def get_repo_remote_owner_name(repo_path: Path) -> Optional[Tuple[str, str]]:
+    """Get (owner, repo_name) for the 'origin' remote of a given repo."""
+    url = get_origin_url(repo_path)
+    if url is None:
         logging.warning("No origin remote for repo: %s", repo_path)
         return None
 
-    owner_repo = parse_github_remote(stdout.strip())
+    owner_repo = parse_github_remote(url)
     if owner_repo is None:
         logging.warning("Could not parse GitHub remote for repo: %s", repo_path)
     return owner_repo
@@ -138,90 +181,111 @@ def get_repo_remote_owner_name(repo_path: Path) -> Optional[Tuple[str, str]]:
 def parse_iso8601(dt_str: str) -> datetime:
     """Parse GitHub ISO 8601 timestamps into timezone-aware datetimes."""
     dt_str = dt_str.strip()
-    # GitHub returns something like "2023-01-02T03:04:05Z"
+    # GitHub returns the fixed shape "2023-01-02T03:04:05Z"; slicing out
+    # the fields beats the general-purpose fromisoformat parser.
+    if len(dt_str) == 20 and dt_str.endswith("Z"):
+        try:
+            return datetime(
+                int(dt_str[0:4]),
+                int(dt_str[5:7]),
+                int(dt_str[8:10]),
+                int(dt_str[11:13]),
+                int(dt_str[14:16]),
+                int(dt_str[17:19]),
+                tzinfo=timezone.utc,
+            )
+        except ValueError:
+            pass
     if dt_str.endswith("Z"):
         dt_str = dt_str.replace("Z", "+00:00")
     return datetime.fromisoformat(dt_str).astimezone(timezone.utc)
 
 
-def query_github_repo(owner: str, name: str) -> Optional[Tuple[bool, datetime]]:
+def query_github_repos(
+    pairs: List[Tuple[str, str]],
+    jobs: int = DEFAULT_JOBS,
+) -> Dict[Tuple[str, str], Tuple[bool, datetime]]:
     """
-    Use `gh` CLI to query if a repo is archived and when it was last updated.
+    Query whether repos are archived and when they were last updated,
+    going through the shared ETag cache (gh_cache) rather than one
+    `gh repo view` subprocess per repo. Unchanged repos revalidate with a
+    304, which costs no rate-limit quota; the cache persists across runs
+    and across the other github scripts.
 
     Returns:
-        (is_archived, updated_at) or None if the query fails.
+        {(owner, name): (is_archived, updated_at)} for repos that resolved.
     """
-    json_fields = "isArchived,updatedAt"
-    stdout = run_command(
-        ["gh", "repo", "view", f"{owner}/{name}", "--json", json_fields]
-    )
-    if stdout is None:
-        logging.warning("Failed to query GitHub for %s/%s", owner, name)
-        return None
-
-    try:
-        data = json.loads(stdout)
-    except json.JSONDecodeError as e:
-        logging.warning("Failed to decode JSON from gh for %s/%s: %s", owner, name, e)
-        return None
-
-    is_archived = bool(data.get("isArchived", False))
-    updated_at_str = data.get("updatedAt")
-    if not updated_at_str:
-        logging.warning("No updatedAt field for %s/%s", owner, name)
-        return None
-
-    updated_at = parse_iso8601(updated_at_str)
-    logging.debug(
-        "GitHub repo %s/%s: is_archived=%s, updated_at=%s",
-        owner,
-        name,
-        is_archived,
-        updated_at,
-    )
-    return is_archived, updated_at
-
-
-def inspect_repo_for_archived_clone(
-    repo_path: Path,
-    focus_owner: Optional[str],
-) -> Optional[ArchivedClone]:
-    owner_repo = get_repo_remote_owner_name(repo_path)
-    if owner_repo is None:
-        return None
-
-    owner, name = owner_repo
-    if focus_owner is not None and owner.lower() != focus_owner.lower():
-        logging.info(
-            "Skipping repo %s (owner %s != focus owner %s)",
-            repo_path,
-            owner,
-            focus_owner,
-        )
-        return None
-
-    gh_info = query_github_repo(owner, name)
-    if gh_info is None:
-        return None
-
-    is_archived, updated_at = gh_info
-    if not is_archived:
-        logging.debug("Repo is not archived: %s/%s (%s)", owner, name, repo_path)
-        return None
-
-    logging.info("💀 Archived repo clone detected: %s/%s (%s)", owner, name, repo_path)
-    return ArchivedClone(path=repo_path, owner=owner, name=name, updated_at=updated_at)
-
-
-def find_archived_clones(root: Path, owner: Optional[str]) -> List[ArchivedClone]:
+    info: Dict[Tuple[str, str], Tuple[bool, datetime]] = {}
+
+    def lookup(pair: Tuple[str, str]) -> Optional[Tuple[bool, datetime]]:
+        owner, name = pair
+        data = gh_cache.get_repo(owner, name)
+        if data is None:
+            return None
+        updated_at_str = data.get("updated_at")
+        if not updated_at_str:
+            logging.warning("No updated_at field for %s/%s", owner, name)
+            return None
+        return bool(data.get("archived", False)), parse_iso8601(updated_at_str)
+
+    with cf.ThreadPoolExecutor(max_workers=jobs) as ex:
+        for pair, result in zip(pairs, ex.map(lookup, pairs)):
+            if result is None:
+                continue
+            logging.debug(
+                "GitHub repo %s/%s: is_archived=%s, updated_at=%s",
+                pair[0],
+                pair[1],
+                result[0],
+                result[1],
+            )
+            info[pair] = result
+
+    return info
+
+
+def find_archived_clones(root: Path, owner: Optional[str], jobs: int = DEFAULT_JOBS) -> List[ArchivedClone]:
     repos = find_git_repos(root)
     logging.info("Scanning %d git repos under %s", len(repos), root)
 
+    # Resolving origin remotes is subprocess bound, so fan it out; logging
+    # is already thread-safe.
+    with cf.ThreadPoolExecutor(max_workers=jobs) as ex:
+        owner_names = list(ex.map(get_repo_remote_owner_name, repos))
+
+    targets: List[Tuple[Path, str, str]] = []
+    for repo_path, owner_repo in zip(repos, owner_names):
+        if owner_repo is None:
+            continue
+        repo_owner, name = owner_repo
+        if owner is not None and repo_owner.lower() != owner.lower():
+            logging.info(
+                "Skipping repo %s (owner %s != focus owner %s)",
+                repo_path,
+                repo_owner,
+                owner,
+            )
+            continue
+        targets.append((repo_path, repo_owner, name))
+
+    info = query_github_repos([(o, n) for _, o, n in targets], jobs=jobs)
+
     archived: List[ArchivedClone] = []
-    for repo_path in repos:
-        result = inspect_repo_for_archived_clone(repo_path, owner)
-        if result is not None:
-            archived.append(result)
+    for repo_path, repo_owner, name in targets:
+        gh_info = info.get((repo_owner, name))
+        if gh_info is None:
+            logging.warning("Failed to query GitHub for %s/%s", repo_owner, name)
+            continue
+
+        is_archived, updated_at = gh_info
+        if not is_archived:
+            logging.debug("Repo is not archived: %s/%s (%s)", repo_owner, name, repo_path)
+            continue
+
+        logging.info("💀 Archived repo clone detected: %s/%s (%s)", repo_owner, name, repo_path)
+        archived.append(
+            ArchivedClone(path=repo_path, owner=repo_owner, name=name, updated_at=updated_at)
+        )
 
     return archived
 
@@ -264,6 +328,13 @@ def build_arg_parser() -> argparse.ArgumentParser:
         default="matthewdeanmartin",
         help="GitHub username/owner to filter on (default: %(default)s).",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=DEFAULT_JOBS,
+        help="Number of repos to inspect concurrently (default: %(default)s).",
+    )
 
     verbosity = parser.add_mutually_exclusive_group()
     verbosity.add_argument(
@@ -296,7 +367,7 @@ def main() -> None:
     logging.info("Root directory: %s", root)
     logging.info("GitHub owner: %s", owner)
 
-    archived = find_archived_clones(root, owner=owner)
+    archived = find_archived_clones(root, owner=owner, jobs=args.jobs)
     print_report(root, archived)
 
 
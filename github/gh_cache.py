@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Shared ETag-backed cache for GitHub repo metadata.
+
+`gh repo view` hides response headers, so scripts that re-check the same
+repos on every run keep spending primary rate-limit quota. Hitting the
+REST API directly with `If-None-Match` turns unchanged repos into 304s,
+which do not count against the rate limit; responses are persisted in
+~/.cache/useful_scripts/gh_repo_view.json so the saving spans runs and
+scripts.
+
+Auth is borrowed from the gh CLI via `gh auth token`.
+
+Dependencies:
+  python -m pip install requests
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import subprocess
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import requests
+
+CACHE_FILE = Path.home() / ".cache" / "useful_scripts" / "gh_repo_view.json"
+ORIGINS_FILE = Path.home() / ".cache" / "useful_scripts" / "origins.json"
+API_ROOT = "https://api.github.com"
+TIMEOUT = 20
+
+_lock = threading.Lock()
+_token: Optional[str] = None
+_session: Optional[requests.Session] = None
+_cache: Optional[Dict[str, Any]] = None
+_cache_dirty = False
+_origins: Optional[Dict[str, List[Any]]] = None
+_origins_dirty = False
+
+
+def gh_token() -> Optional[str]:
+    """Harvest the gh CLI's auth token once per process."""
+    global _token
+    with _lock:
+        if _token is None:
+            try:
+                result = subprocess.run(
+                    ["gh", "auth", "token"],
+                    capture_output=True,
+                    text=True,
+                    check=False,
+                )
+            except FileNotFoundError:
+                return None
+            if result.returncode == 0:
+                _token = result.stdout.strip()
+        return _token
+
+
+def session() -> requests.Session:
+    """One keepalive session shared by all api.github.com calls."""
+    global _session
+    with _lock:
+        if _session is None:
+            _session = requests.Session()
+            _session.headers.update({"Accept": "application/vnd.github+json"})
+    # Token lookup happens outside the lock; gh_token locks internally.
+    token = gh_token()
+    if token and "Authorization" not in _session.headers:
+        _session.headers["Authorization"] = f"token {token}"
+    return _session
+
+
+def _load_cache() -> Dict[str, Any]:
+    global _cache
+    if _cache is None:
+        try:
+            _cache = json.loads(CACHE_FILE.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            _cache = {}
+    return _cache
+
+
+def _save_cache() -> None:
+    if _cache is None:
+        return
+    try:
+        CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        CACHE_FILE.write_text(json.dumps(_cache), encoding="utf-8")
+    except OSError:
+        pass
+
+
+def _load_origins() -> Dict[str, List[Any]]:
+    global _origins
+    if _origins is None:
+        try:
+            _origins = json.loads(ORIGINS_FILE.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            _origins = {}
+    return _origins
+
+
+def _save_origins() -> None:
+    if _origins is None:
+        return
+    try:
+        ORIGINS_FILE.parent.mkdir(parents=True, exist_ok=True)
+        ORIGINS_FILE.write_text(json.dumps(_origins), encoding="utf-8")
+    except OSError:
+        pass
+
+
+def origin_url(repo_path: Path, resolver: Callable[[Path], Optional[str]]) -> Optional[str]:
+    """
+    Memoize origin remote URLs across runs and scripts.
+
+    Entries are keyed on .git/config's st_mtime_ns — the URL can only
+    change when that file does — so after the first run not even the
+    config parse happens. `resolver` does the real lookup on a miss.
+    """
+    global _origins_dirty
+    config_path = os.path.join(str(repo_path), ".git", "config")
+    try:
+        mtime_ns = os.stat(config_path).st_mtime_ns
+    except OSError:
+        return resolver(repo_path)
+
+    key = os.path.abspath(str(repo_path))
+    with _lock:
+        entry = _load_origins().get(key)
+        if entry and entry[0] == mtime_ns:
+            return entry[1]
+
+    url = resolver(repo_path)
+    with _lock:
+        _load_origins()[key] = [mtime_ns, url]
+        _origins_dirty = True
+    return url
+
+
+def flush() -> None:
+    """
+    Persist any pending cache updates to disk.
+
+    Updates only mutate the in-memory dicts (rewriting the whole JSON
+    file per hit would make a cold scan of N repos O(N^2) serialized
+    bytes, under the lock the worker threads contend on). Registered
+    via atexit, so scripts normally never call this themselves.
+    """
+    global _cache_dirty, _origins_dirty
+    with _lock:
+        if _cache_dirty:
+            _save_cache()
+            _cache_dirty = False
+        if _origins_dirty:
+            _save_origins()
+            _origins_dirty = False
+
+
+atexit.register(flush)
+
+
+def get_repo(owner: str, name: str) -> Optional[Dict[str, Any]]:
+    """
+    Return the REST repo object for owner/name, or None on failure.
+
+    Sends `If-None-Match` with the cached ETag; a 304 serves the cached
+    copy without spending rate-limit quota. Network failures also fall
+    back to the cached copy when one exists.
+    """
+    global _cache_dirty
+    key = f"{owner}/{name}"
+    with _lock:
+        entry = _load_cache().get(key) or {}
+
+    headers: Dict[str, str] = {}
+    if entry.get("etag") and entry.get("data") is not None:
+        headers["If-None-Match"] = entry["etag"]
+
+    try:
+        resp = session().get(f"{API_ROOT}/repos/{key}", headers=headers, timeout=TIMEOUT)
+    except requests.RequestException:
+        return entry.get("data")
+
+    if resp.status_code == 304:
+        return entry.get("data")
+    if resp.status_code != 200:
+        return None
+
+    data = resp.json()
+    with _lock:
+        _load_cache()[key] = {
+            "etag": resp.headers.get("ETag"),
+            "data": data,
+            "fetched_at": time.time(),
+        }
+        _cache_dirty = True
+    return data
@@ -11,26 +11,42 @@ Heuristics:
 
 from __future__ import annotations
 
+import functools
+import os
 import re
-import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+try:
+    import yaml
+
+    # The C loader tokenizes an order of magnitude faster than the
+    # pure-Python one; fall back gracefully when libyaml is absent.
+    _YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+except ImportError:
+    yaml = None  # type: ignore[assignment]
+    _YAML_LOADER = None
 
 # Threshold: anything strictly less than this is considered "too old"
 PYTHON_VERSION_THRESHOLD: Tuple[int, int, int] = (3, 14, 0)
 
+# File reads block on I/O, so oversubscribe relative to cores.
+MAX_WORKERS: int = min(32, (os.cpu_count() or 4) * 4)
+
+# Compiled once; these run on every candidate line of every workflow file.
+_VERSION_FULL_RE = re.compile(r"\d+(?:\.\d+){1,2}")
+_VERSION_FIND_RE = re.compile(r'["\']?(\d+(?:\.\d+){1,2})["\']?')
+
 
 def is_git_repo(path: Path) -> bool:
-    """Return True if `path` is a Git repository."""
-    result = subprocess.run(
-        ["git", "-C", str(path), "rev-parse", "--is-inside-work-tree"],
-        capture_output=True,
-        text=True,
-        check=False,
-    )
-    return result.returncode == 0 and result.stdout.strip() == "true"
+    """Return True if `path` is a Git repository (a couple of stats, no subprocess)."""
+    git_marker = path / ".git"
+    # A .git *file* is a worktree/submodule gitfile pointer.
+    return git_marker.is_dir() or git_marker.is_file()
 
 
+@functools.lru_cache(maxsize=512)
 def parse_version(version: str) -> Optional[Tuple[int, int, int]]:
     """
     Parse a version string like '3.10', '3.13.1' into (3, 10, 0) / (3, 13, 1).
@@ -38,7 +54,7 @@ def parse_version(version: str) -> Optional[Tuple[int, int, int]]:
     """
     version = version.strip()
     # Basic sanity filter
-    if not re.fullmatch(r"\d+(?:\.\d+){1,2}", version):
+    if not _VERSION_FULL_RE.fullmatch(version):
         return None
 
     parts = version.split(".")
@@ -54,6 +70,7 @@ def parse_version(version: str) -> Optional[Tuple[int, int, int]]:
     return nums[0], nums[1], nums[2]
 
 
+@functools.lru_cache(maxsize=512)
 def is_legacy_python_version(version: str) -> bool:
     """True if the parsed version is < PYTHON_VERSION_THRESHOLD."""
     parsed = parse_version(version)
@@ -66,8 +83,23 @@ def extract_versions_from_text(text: str) -> List[str]:
     """
     Extract all version-like strings (e.g. 3.8, 3.10, 3.13.1) from a text fragment.
     """
-    pattern = re.compile(r'["\']?(\d+(?:\.\d+){1,2})["\']?')
-    return pattern.findall(text)
+    return _VERSION_FIND_RE.findall(text)
+
+
+def _collect_python_versions(node: Any, found: Set[str]) -> None:
+    """Walk a parsed YAML tree collecting python-version values."""
+    if isinstance(node, dict):
+        for key, value in node.items():
+            if key == "python-version":
+                values = value if isinstance(value, list) else [value]
+                for item in values:
+                    for ver in extract_versions_from_text(str(item)):
+                        found.add(ver)
+            else:
+                _collect_python_versions(value, found)
+    elif isinstance(node, list):
+        for item in node:
+            _collect_python_versions(item, found)
 
 
 def find_legacy_python_versions_in_text(text: str) -> Set[str]:
@@ -75,6 +107,27 @@ def find_legacy_python_versions_in_text(text: str) -> Set[str]:
     Given full YAML text of a workflow file, find all python-version entries
     whose versions are < 3.14.
 
+    Parses the document with PyYAML (C loader when available) and walks the
+    tree; the regex scan below remains as the fallback for malformed YAML
+    or environments without PyYAML.
+    """
+    if _YAML_LOADER is not None:
+        try:
+            doc = yaml.load(text, Loader=_YAML_LOADER)
+        except yaml.YAMLError:
+            doc = None
+        if doc is not None:
+            candidates: Set[str] = set()
+            _collect_python_versions(doc, candidates)
+            return {ver for ver in candidates if is_legacy_python_version(ver)}
+
+    return _find_legacy_python_versions_by_regex(text)
+
+
+def _find_legacy_python_versions_by_regex(text: str) -> Set[str]:
+    """
+    Line-by-line fallback scan.
+
     Handles:
     - Inline: python-version: "3.10"
     - Inline list: python-version: ["3.10", "3.11"]
@@ -139,10 +192,36 @@ def find_legacy_python_versions_in_text(text: str) -> Set[str]:
 def find_legacy_python_versions_in_file(path: Path) -> Set[str]:
     """Return all legacy python versions referenced in a YAML workflow file."""
     try:
-        text = path.read_text(encoding="utf-8", errors="ignore")
+        data = path.read_bytes()
     except OSError:
         return set()
-    return find_legacy_python_versions_in_text(text)
+    # Most workflows never mention python-version; one memmem-backed bytes
+    # scan rejects them before we pay for decode + YAML parse.
+    if b"python-version" not in data:
+        return set()
+    return find_legacy_python_versions_in_text(data.decode("utf-8", "ignore"))
+
+
+def _iter_workflow_files(workflows_dir: Path) -> List[Path]:
+    """
+    Recursively collect *.yml / *.yaml files under `workflows_dir` with one
+    os.scandir walk (rglob would walk twice, once per pattern, and build a
+    Path per directory entry either way).
+    """
+    found: List[Path] = []
+    stack: List[str] = [str(workflows_dir)]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith((".yml", ".yaml")):
+                        found.append(Path(entry.path))
+        except OSError:
+            continue
+    return found
 
 
 def find_repos_with_legacy_actions(root: Path) -> Dict[Path, List[Tuple[Path, Set[str]]]]:
@@ -155,6 +234,10 @@ def find_repos_with_legacy_actions(root: Path) -> Dict[Path, List[Tuple[Path, Se
     """
     results: Dict[Path, List[Tuple[Path, Set[str]]]] = {}
 
+    # First gather every (repo, workflow file) pair, then scan the files
+    # in one thread pool so slow disks/network mounts overlap.
+    candidates: List[Tuple[Path, Path]] = []
+
     for entry in root.iterdir():
         if not entry.is_dir():
             continue
@@ -165,16 +248,16 @@ def find_repos_with_legacy_actions(root: Path) -> Dict[Path, List[Tuple[Path, Se
         if not workflows_dir.is_dir():
             continue
 
-        matching_files: List[Tuple[Path, Set[str]]] = []
-
-        for pattern in ("*.yml", "*.yaml"):
-            for wf in workflows_dir.rglob(pattern):
-                legacy_versions = find_legacy_python_versions_in_file(wf)
-                if legacy_versions:
-                    matching_files.append((wf, legacy_versions))
+        for wf in _iter_workflow_files(workflows_dir):
+            candidates.append((entry, wf))
 
-        if matching_files:
-            results[entry] = matching_files
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+        versions_per_file = ex.map(
+            find_legacy_python_versions_in_file, (wf for _, wf in candidates)
+        )
+        for (repo, wf), legacy_versions in zip(candidates, versions_per_file):
+            if legacy_versions:
+                results.setdefault(repo, []).append((wf, legacy_versions))
 
     return results
 
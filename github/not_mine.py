@@ -3,70 +3,67 @@
 Scan current directory for Git repos that are forks of someone else's repo.
 
 Requirements:
-- git and gh must be on PATH
-- gh must be authenticated
+- gh must be installed and authenticated (its token is borrowed for the
+  REST calls; no gh subprocess is spawned per repo)
 """
 
 from __future__ import annotations
 
-import json
-import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+import gh_cache
+from find_the_archives import get_origin_url, parse_github_remote
+
 GITHUB_USERNAME: str = "matthewdeanmartin"
 
+# Each worker just waits on a gh subprocess / network round trip.
+MAX_WORKERS: int = 16
+
 
 def is_git_repo(path: Path) -> bool:
-    """Return True if `path` is a Git repository."""
-    try:
-        result = subprocess.run(
-            ["git", "-C", str(path), "rev-parse", "--is-inside-work-tree"],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-        return result.returncode == 0 and result.stdout.strip() == "true"
-    except OSError:
-        return False
+    """Return True if `path` is a Git repository (a couple of stats, no subprocess)."""
+    git_marker = path / ".git"
+    # A .git *file* is a worktree/submodule gitfile pointer.
+    return git_marker.is_dir() or git_marker.is_file()
 
 
 def gh_repo_view(path: Path) -> Optional[Dict[str, Any]]:
     """
-    Run `gh repo view` in the given repo directory and return parsed JSON,
-    or None if the command fails.
+    Fetch repo metadata through the shared ETag-cached REST session
+    (gh_cache) instead of a `gh repo view` subprocess per repo, and shape
+    the answer like the gh JSON the rest of this script expects.
     """
-    try:
-        result = subprocess.run(
-            [
-                "gh",
-                "repo",
-                "view",
-                "--json",
-                "name,owner,isFork,parent",
-            ],
-            cwd=path,
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-    except OSError:
-        print(f"⚠️  gh command not found when processing {path}")
+    url = get_origin_url(path)
+    if url is None:
+        print(f"⚠️  No origin remote for {path.name}")
         return None
 
-    if result.returncode != 0:
-        # Most likely not a GitHub repo, or no access
-        stderr = result.stderr.strip()
-        print(f"⚠️  Failed to query GitHub for {path.name}: {stderr}")
+    owner_repo = parse_github_remote(url)
+    if owner_repo is None:
+        print(f"⚠️  Not a GitHub remote for {path.name}: {url}")
         return None
 
-    try:
-        data: Dict[str, Any] = json.loads(result.stdout)
-    except json.JSONDecodeError as exc:
-        print(f"⚠️  Failed to parse JSON for {path.name}: {exc}")
+    data = gh_cache.get_repo(*owner_repo)
+    if data is None:
+        # Most likely not a GitHub repo, or no access
+        print(f"⚠️  Failed to query GitHub for {path.name}")
         return None
 
-    return data
+    parent = data.get("parent") or {}
+    return {
+        "name": data.get("name"),
+        "owner": {"login": (data.get("owner") or {}).get("login", "")},
+        "isFork": bool(data.get("fork", False)),
+        "parent": {
+            "name": parent.get("name"),
+            "nameWithOwner": parent.get("full_name"),
+            "owner": {"login": (parent.get("owner") or {}).get("login", "")},
+        }
+        if parent
+        else None,
+    }
 
 
 def is_fork_of_other_user(repo_info: Dict[str, Any], username: str) -> bool:
@@ -95,14 +92,15 @@ def find_forked_repos(root: Path, username: str) -> List[Tuple[Path, Dict[str, A
     """Return list of (path, repo_info) for repos that are forks of someone else."""
     results: List[Tuple[Path, Dict[str, Any]]] = []
 
-    for entry in root.iterdir():
-        if not entry.is_dir():
-            continue
+    repos = [
+        entry for entry in root.iterdir() if entry.is_dir() and is_git_repo(entry)
+    ]
 
-        if not is_git_repo(entry):
-            continue
+    # Each gh call is a network round trip, so fan them out.
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+        infos = list(ex.map(gh_repo_view, repos))
 
-        repo_info = gh_repo_view(entry)
+    for entry, repo_info in zip(repos, infos):
         if not repo_info:
             continue
 
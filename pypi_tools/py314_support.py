@@ -14,6 +14,7 @@ Notes:
 
 Dependencies:
   python -m pip install requests packaging
+  python -m pip install orjson  # optional, faster JSON parsing
 """
 from __future__ import annotations
 
@@ -25,18 +26,39 @@ from collections.abc import Iterable
 from dataclasses import dataclass
 
 import requests
+from requests.adapters import HTTPAdapter, Retry
 from packaging.specifiers import SpecifierSet
+
+try:
+    # Rust-backed parser; the per-release JSON decode is the inner loop here.
+    from orjson import loads
+except ImportError:
+    from json import loads
 from packaging.version import InvalidVersion, Version
 
 XMLRPC_URL = "https://pypi.org/pypi"
 JSON_PROJECT = "https://pypi.org/pypi/{name}/json"
 JSON_RELEASE = "https://pypi.org/pypi/{name}/{version}/json"
+SIMPLE_PROJECT = "https://pypi.org/simple/{name}/"
+SIMPLE_ACCEPT = "application/vnd.pypi.simple.v1+json"  # PEP 691
 TIMEOUT = 20
 MAX_WORKERS = 6
 
 PY_TAG = "Programming Language :: Python :: 3.14"
 PY_VERSION_STR = "3.14"
 
+# One keepalive pool to pypi.org instead of a TLS handshake per request;
+# pool_maxsize leaves headroom for the thread pools above MAX_WORKERS.
+SESSION = requests.Session()
+SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=MAX_WORKERS,
+        pool_maxsize=MAX_WORKERS * 4,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]),
+    ),
+)
+
 @dataclass(frozen=True)
 class SupportResult:
     name: str
@@ -54,12 +76,13 @@ def list_user_projects(username: str) -> list[str]:
     names = sorted({name for _role, name in pairs}, key=str.lower)
     return names
 
-def _releases_sorted(name: str) -> list[str]:
-    # hit project JSON once to get the release list cheaply
-    r = requests.get(JSON_PROJECT.format(name=name), timeout=TIMEOUT)
+def _releases_sorted(name: str) -> tuple[list[str], dict]:
+    # hit project JSON once to get the release list cheaply; the same
+    # payload carries the latest release's info, so hand that back too
+    r = SESSION.get(JSON_PROJECT.format(name=name), timeout=TIMEOUT)
     if r.status_code != 200:
-        return []
-    data = r.json()
+        return [], {}
+    data = loads(r.content)
     versions = list(data.get("releases", {}).keys())
     def key(v: str):
         try:
@@ -68,14 +91,10 @@ def _releases_sorted(name: str) -> list[str]:
             # put weird versions at the end, but keep determinism
             return Version("0!0")
     versions.sort(key=key, reverse=True)
-    return versions
+    return versions, data.get("info", {}) or {}
 
-def _release_supports(name: str, version: str) -> tuple[bool, str]:
-    # fetch per-release JSON for classifiers & requires_python
-    r = requests.get(JSON_RELEASE.format(name=name, version=version), timeout=TIMEOUT)
-    if r.status_code != 200:
-        return (False, "")
-    info = r.json().get("info", {})
+def _info_supports(info: dict) -> tuple[bool, str]:
+    # shared check over an "info" dict (project-level or per-release)
     classifiers: Iterable[str] = info.get("classifiers", []) or []
     if PY_TAG in classifiers:
         return (True, "classifier")
@@ -88,12 +107,85 @@ def _release_supports(name: str, version: str) -> tuple[bool, str]:
             pass
     return (False, "")
 
+def _version_from_filename(filename: str) -> str | None:
+    # wheel: name-version-pytag-abitag-platform.whl; sdist: name-version.tar.gz
+    if filename.endswith(".whl"):
+        parts = filename.split("-")
+        return parts[1] if len(parts) >= 2 else None
+    for ext in (".tar.gz", ".zip", ".tar.bz2"):
+        if filename.endswith(ext):
+            stem = filename[: -len(ext)]
+            if "-" in stem:
+                return stem.rsplit("-", 1)[1]
+    return None
+
+def _simple_requires_python(name: str) -> dict[str, str | None]:
+    # The PEP 691 simple index is a fraction of the size of the release
+    # JSON and already carries requires-python per file.
+    r = SESSION.get(
+        SIMPLE_PROJECT.format(name=name),
+        headers={"Accept": SIMPLE_ACCEPT},
+        timeout=TIMEOUT,
+    )
+    if r.status_code != 200:
+        return {}
+    out: dict[str, str | None] = {}
+    for file_info in loads(r.content).get("files", []) or []:
+        version = _version_from_filename(file_info.get("filename", ""))
+        if version is None:
+            continue
+        rp = file_info.get("requires-python")
+        if version not in out or rp:
+            out[version] = rp
+    return out
+
+def _release_supports(name: str, version: str) -> tuple[bool, str]:
+    # fetch per-release JSON for classifiers & requires_python
+    r = SESSION.get(JSON_RELEASE.format(name=name, version=version), timeout=TIMEOUT)
+    if r.status_code != 200:
+        return (False, "")
+    return _info_supports(loads(r.content).get("info", {}))
+
 def check_project(name: str) -> SupportResult:
-    versions = _releases_sorted(name)
-    for v in versions:
-        ok, why = _release_supports(name, v)
-        if ok:
-            return SupportResult(name=name, supported=True, version=v, reason=why)
+    versions, latest_info = _releases_sorted(name)
+
+    # The project JSON already describes the latest release; for most
+    # projects that decides the question with zero per-release fetches.
+    ok, why = _info_supports(latest_info)
+    if ok:
+        version = latest_info.get("version") or (versions[0] if versions else None)
+        return SupportResult(name=name, supported=True, version=version, reason=why)
+
+    latest_version = latest_info.get("version")
+    remaining = [v for v in versions if v != latest_version]  # latest ruled out above
+
+    # One compact simple-index fetch decides most versions from their
+    # requires-python; the full release JSON is only pulled for versions
+    # the index leaves undecided.
+    rp_by_version = _simple_requires_python(name) if remaining else {}
+
+    def decide(v: str) -> tuple[bool, str]:
+        rp = rp_by_version.get(v)
+        if rp:
+            try:
+                supported = SpecifierSet(rp).contains(PY_VERSION_STR, prereleases=True)
+                return (supported, "requires_python" if supported else "")
+            except Exception:
+                pass
+        return _release_supports(name, v)
+
+    # Probe releases in batches of a few at a time so HTTP latency overlaps,
+    # but consume results newest-first so "newest supporting release"
+    # semantics are unchanged.
+    batch_size = 8
+    with cf.ThreadPoolExecutor(max_workers=4) as ex:
+        for start in range(0, len(remaining), batch_size):
+            batch = remaining[start : start + batch_size]
+            futures = [ex.submit(decide, v) for v in batch]
+            for v, fut in zip(batch, futures):
+                ok, why = fut.result()
+                if ok:
+                    return SupportResult(name=name, supported=True, version=v, reason=why)
     return SupportResult(name=name, supported=False, version=None, reason="")
 
 def main() -> None:
@@ -9,57 +9,156 @@ Usage:
 """
 
 from __future__ import annotations
-import subprocess
+import argparse
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Optional
 
+# Probes are I/O bound, so oversubscribe relative to cores (matches the
+# stdlib's own ThreadPoolExecutor default heuristic).
+DEFAULT_JOBS: int = min(32, (os.cpu_count() or 4) * 5)
 
-def get_python_version(venv_path: Path) -> Optional[str]:
+# pyvenv.cfg yields "3.14.1"; `python --version` style output would be
+# "Python 3.14.1". A prefix match is anchored, unlike `"3.14" in version`.
+PY14_PREFIXES: tuple[str, ...] = ("Python 3.14", "3.14")
+
+# Directories that are never projects; skipping them up front saves the
+# downstream per-entry work. Override with a comma-separated PY14_SKIP.
+SKIP_DIRS: frozenset[str] = frozenset(
+    os.environ.get(
+        "PY14_SKIP",
+        ".git,.idea,.vscode,node_modules,__pycache__,.mypy_cache,.pytest_cache,.tox",
+    ).split(",")
+)
+
+# Versions persist across runs, keyed on pyvenv.cfg's mtime, so watch
+# loops and repeated scans cost one stat per unchanged venv.
+CACHE_FILE = Path.home() / ".cache" / "useful_scripts" / "py14_versions.json"
+
+
+def _load_version_cache() -> dict[str, list]:
+    try:
+        return json.loads(CACHE_FILE.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def _save_version_cache(cache: dict[str, list]) -> None:
+    try:
+        CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        CACHE_FILE.write_text(json.dumps(cache), encoding="utf-8")
+    except OSError:
+        pass
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Check that each project's .venv runs Python 3.14."
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=DEFAULT_JOBS,
+        help="Number of venvs to probe concurrently (default: %(default)s).",
+    )
+    return parser.parse_args()
+
+
+def get_python_version(venv_path: str | Path, cache: Optional[dict[str, list]] = None) -> Optional[str]:
     """Return the Python version string from the given .venv or None if invalid."""
-    exe = venv_path / "Scripts" / "python.exe" if (venv_path / "Scripts" / "python.exe").exists() \
-        else venv_path / "bin" / "python"
-    if not exe.exists():
-        return None
+    # Every CPython venv writes a `version = 3.14.x` (older: `version_info`)
+    # line into pyvenv.cfg; reading it beats spawning an interpreter just to
+    # print its own version, and the file lives in the same place on every OS.
+    # Plain-string joins keep Path parsing/allocation out of the hot path.
+    cfg = os.path.join(str(venv_path), "pyvenv.cfg")
+
+    key: Optional[str] = None
+    mtime_ns: Optional[int] = None
+    if cache is not None:
+        key = os.path.abspath(str(venv_path))
+        try:
+            mtime_ns = os.stat(cfg).st_mtime_ns
+        except OSError:
+            return None
+        entry = cache.get(key)
+        if entry and entry[0] == mtime_ns:
+            return entry[1]
 
+    # One open doubles as the existence probe — a missing or unreadable
+    # pyvenv.cfg surfaces as OSError, saving a separate is_file() stat.
     try:
-        result = subprocess.run(
-            [str(exe), "--version"],
-            check=False,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            timeout=5,
-        )
-        return result.stdout.strip()
-    except Exception:
+        with open(cfg, "rb") as f:
+            data = f.read()
+    except OSError:
         return None
 
+    # The key is ASCII, so scan the raw bytes and decode only the one
+    # matched value.
+    version: Optional[str] = None
+    for line in data.splitlines():
+        if line.startswith(b"version"):
+            version = line.split(b"=", 1)[1].strip().decode("utf-8", "ignore")
+            break
+
+    if cache is not None and key is not None:
+        cache[key] = [mtime_ns, version]
+    return version
+
 
 def main() -> None:
+    args = parse_args()
     base = Path.cwd()
+
+    # Collect the candidates first, then probe the venvs concurrently —
+    # each probe waits on file I/O. os.scandir answers is_dir() from the
+    # readdir entry without an extra stat per directory; access(2) is
+    # cheaper than stat(2) when only existence matters, and Path objects
+    # are only built for the survivors.
+    # Each candidate keeps the joined .venv string from the prefilter so
+    # the probe never re-derives or re-parses the path.
+    with os.scandir(base) as it:
+        candidates = [
+            (entry.name, venv)
+            for entry in it
+            if entry.is_dir(follow_symlinks=False)
+            and not entry.name.startswith(".")
+            and entry.name not in SKIP_DIRS
+            and os.access(venv := os.path.join(entry.path, ".venv"), os.F_OK)
+        ]
+
+    if not candidates:
+        print("\n0 good repos")
+        return
+
+    # Distinct-key dict writes are safe under the GIL, so the threads can
+    # share the cache; it is persisted once at the end.
+    cache = _load_version_cache()
+
+    def probe(venv: str) -> Optional[str]:
+        return get_python_version(venv, cache)
+
+    # Problems print as each probe finishes, so slow filesystems show
+    # progress instead of going silent for the whole scan.
     good = 0
-    bad: list[tuple[str, str]] = []
-
-    for project_dir in base.iterdir():
-        if not project_dir.is_dir():
-            continue
-        venv = project_dir / ".venv"
-        if not venv.exists():
-            continue
-
-        version = get_python_version(venv)
-        if version is None:
-            bad.append((project_dir.name, "no python found"))
-        elif "3.14" in version:
-            good += 1
-        else:
-            bad.append((project_dir.name, version))
-
-    # Output
-    if bad:
-        print("Non-3.14 virtual environments detected:")
-        for name, version in bad:
-            print(f"  {name}: {version}")
+    header_shown = False
+    with ThreadPoolExecutor(max_workers=min(args.jobs, len(candidates))) as ex:
+        futures = {ex.submit(probe, venv): name for name, venv in candidates}
+        for fut in as_completed(futures):
+            name = futures[fut]
+            version = fut.result()
+            if version is not None and version.startswith(PY14_PREFIXES):
+                good += 1
+                continue
+            if not header_shown:
+                print("Non-3.14 virtual environments detected:")
+                header_shown = True
+            print(f"  {name}: {version if version is not None else 'no python found'}")
+
+    _save_version_cache(cache)
+
     print(f"\n{good} good repos")
 
 
@@ -8,71 +8,133 @@ Heuristics:
 
 from __future__ import annotations
 
-import subprocess
+import argparse
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List
+from typing import Callable, List, Optional
 
+# Per-repo checks are a handful of stats/reads; threads overlap the
+# round-trips on slow filesystems (NFS, SSHFS).
+DEFAULT_JOBS: int = min(32, (os.cpu_count() or 4) * 5)
 
-def is_git_repo(path: Path) -> bool:
-    """Return True if `path` is a Git repository."""
-    result = subprocess.run(
-        ["git", "-C", str(path), "rev-parse", "--is-inside-work-tree"],
-        capture_output=True,
-        text=True,
-        check=False,
+# Directories that are never repos; skipping them up front saves the
+# downstream per-entry work. Same PY14_SKIP override as py14.py.
+SKIP_DIRS: frozenset[str] = frozenset(
+    os.environ.get(
+        "PY14_SKIP",
+        ".git,.idea,.vscode,node_modules,__pycache__,.mypy_cache,.pytest_cache,.tox",
+    ).split(",")
+)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="List immediate subdirectories that are git repos still using Poetry."
     )
-    return result.returncode == 0 and result.stdout.strip() == "true"
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=DEFAULT_JOBS,
+        help="Number of repos to check concurrently (default: %(default)s).",
+    )
+    return parser.parse_args()
 
 
-def uses_poetry(path: Path) -> bool:
+def uses_poetry(path: str | Path, children: frozenset[str]) -> bool:
     """
     Detect whether repo at `path` uses Poetry.
 
     - poetry.lock present, OR
     - pyproject.toml with '[tool.poetry]' in it.
+
+    `children` is the scandir-derived set of child names, so both
+    presence checks are O(1) lookups instead of stats.
     """
-    poetry_lock = path / "poetry.lock"
-    if poetry_lock.is_file():
+    if "poetry.lock" in children:
         return True
 
-    pyproject = path / "pyproject.toml"
-    if pyproject.is_file():
+    pyproject = os.path.join(str(path), "pyproject.toml")
+    if "pyproject.toml" in children:
         try:
-            text = pyproject.read_text(encoding="utf-8", errors="ignore")
+            # The marker is ASCII, so a bytes search skips the UTF-8 decode.
+            # [tool.poetry] conventionally sits near the top, so one 8 KB
+            # read settles almost every file; only oversized ones with no
+            # marker in the head get a full scan.
+            with open(pyproject, "rb") as f:
+                head = f.read(8192)
+                if b"[tool.poetry]" in head:
+                    return True
+                if len(head) < 8192:
+                    return False
+                data = head + f.read()
         except OSError:
             return False
-        return "[tool.poetry]" in text
+        return b"[tool.poetry]" in data
 
     return False
 
 
-def find_poetry_repos(root: Path) -> List[Path]:
-    """Return all immediate subdirectories that are git repos using Poetry."""
+def find_poetry_repos(
+    root: Path,
+    jobs: int = DEFAULT_JOBS,
+    on_found: Optional[Callable[[Path], None]] = None,
+) -> List[Path]:
+    """
+    Return all immediate subdirectories that are git repos using Poetry.
+
+    `on_found` fires as each hit completes, so callers can show progress
+    before the whole scan finishes.
+    """
+    # os.scandir answers is_dir() from the readdir entry without an extra
+    # stat per directory; the checks run on plain strings and Paths are
+    # only built for the repos that pass.
+    with os.scandir(root) as it:
+        paths = [
+            entry.path
+            for entry in it
+            if entry.is_dir(follow_symlinks=False)
+            and not entry.name.startswith(".")
+            and entry.name not in SKIP_DIRS
+        ]
+
+    def check(path: str) -> bool:
+        # One scandir yields every child name, replacing the separate
+        # .git / poetry.lock / pyproject.toml stats.
+        try:
+            with os.scandir(path) as children_it:
+                children = frozenset(e.name for e in children_it)
+        except OSError:
+            return False
+        return ".git" in children and uses_poetry(path, children)
+
     results: List[Path] = []
-    for entry in root.iterdir():
-        if not entry.is_dir():
-            continue
-        if not is_git_repo(entry):
-            continue
-        if uses_poetry(entry):
-            results.append(entry)
+    with ThreadPoolExecutor(max_workers=jobs) as ex:
+        futures = {ex.submit(check, path): path for path in paths}
+        for fut in as_completed(futures):
+            if fut.result():
+                found = Path(futures[fut])
+                if on_found is not None:
+                    on_found(found)
+                results.append(found)
     return results
 
 
 def main() -> None:
+    args = parse_args()
     root = Path.cwd()
-    print(f"🔍 Scanning for Poetry-based repos in: {root}")
+    print(f"🔍 Scanning for Poetry-based repos in: {root}\n")
 
-    poetry_repos = find_poetry_repos(root)
+    # Hits stream as they are found, so slow filesystems show progress.
+    poetry_repos = find_poetry_repos(
+        root, jobs=args.jobs, on_found=lambda repo: print(f"📁 {repo.name} 🧪")
+    )
 
     if not poetry_repos:
         print("✅ No Poetry-based repos found among immediate subdirectories.")
         return
 
-    print("\n📦 Repos still using Poetry:\n")
-    for repo in poetry_repos:
-        print(f"📁 {repo.name} 🧪")
-
     print(f"\n📊 Total Poetry repos: {len(poetry_repos)}")
 
 